@@ -6,12 +6,16 @@ use std::time::{Duration, Instant};
 use tokio::sync::Mutex;
 use tracing::{debug, warn};
 
+/// Maximum number of retries after an HTTP 429 before giving up
+const MAX_RATE_LIMIT_RETRIES: u32 = 3;
+
+/// Upper bound on a server-requested `Retry-After` delay
+const MAX_RETRY_AFTER: Duration = Duration::from_secs(60);
+
 /// Rate limiter for API requests
 struct RateLimiter {
     last_request: Instant,
     min_interval: Duration,
-    #[allow(dead_code)]
-    retry_count: u32,
 }
 
 impl RateLimiter {
@@ -19,7 +23,6 @@ impl RateLimiter {
         Self {
             last_request: Instant::now() - Duration::from_secs(1), // Allow first request immediately
             min_interval: Duration::from_secs_f64(1.0 / requests_per_second),
-            retry_count: 0,
         }
     }
 
@@ -32,19 +35,12 @@ impl RateLimiter {
         }
         self.last_request = Instant::now();
     }
+}
 
-    #[allow(dead_code)]
-    fn backoff_duration(&mut self) -> Duration {
-        self.retry_count += 1;
-        // Exponential backoff: 1s, 2s, 4s, 8s, 16s (max)
-        let backoff_secs = 2_u64.pow(self.retry_count.min(4));
-        Duration::from_secs(backoff_secs)
-    }
-
-    #[allow(dead_code)]
-    fn reset_retry_count(&mut self) {
-        self.retry_count = 0;
-    }
+/// Delay before retry number `attempt` (0-based) when the server sends no `Retry-After`
+fn backoff_duration(attempt: u32) -> Duration {
+    // Exponential backoff: 1s, 2s, 4s, 8s, 16s (max)
+    Duration::from_secs(2_u64.pow(attempt.min(4)))
 }
 
 /// Client for the deps.dev API
@@ -104,6 +100,33 @@ impl DepsDevClient {
         }
     }
 
+    /// Send a GET request, retrying on HTTP 429
+    ///
+    /// Honors the server's `Retry-After` header (in seconds) when present and
+    /// falls back to exponential backoff otherwise. Once the retries are
+    /// exhausted the 429 response is returned to the caller unchanged.
+    ///
+    /// The retry budget is tracked per call, so concurrent requests sharing
+    /// this client don't consume or reset each other's retries.
+    async fn get_with_retry(&self, url: &str) -> Result<reqwest::Response> {
+        let mut attempt = 0;
+        loop {
+            // Apply rate limiting before making request
+            self.rate_limiter.lock().await.wait_if_needed().await;
+
+            let response = self.client.get(url).send().await?;
+
+            if response.status() != 429 || attempt >= MAX_RATE_LIMIT_RETRIES {
+                return Ok(response);
+            }
+
+            let wait = retry_after(&response).unwrap_or_else(|| backoff_duration(attempt));
+            attempt += 1;
+            warn!("Rate limited by deps.dev, retrying in {:?}", wait);
+            tokio::time::sleep(wait).await;
+        }
+    }
+
     /// Get version information for a specific package version
     ///
     /// ## Example
@@ -127,9 +150,6 @@ impl DepsDevClient {
         package: &str,
         version: &str,
     ) -> Result<VersionInfo> {
-        // Apply rate limiting before making request
-        self.rate_limiter.lock().await.wait_if_needed().await;
-
         let url = format!(
             "{}/systems/{}/packages/{}/versions/{}",
             self.base_url,
@@ -140,7 +160,7 @@ impl DepsDevClient {
 
         debug!("Fetching version info: {}", url);
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.get_with_retry(&url).await?;
 
         if response.status().is_success() {
             let version_info = response.json::<VersionInfo>().await?;
@@ -190,9 +210,6 @@ impl DepsDevClient {
         package: &str,
         version: &str,
     ) -> Result<DependencyGraph> {
-        // Apply rate limiting before making request
-        self.rate_limiter.lock().await.wait_if_needed().await;
-
         let url = format!(
             "{}/systems/{}/packages/{}/versions/{}:dependencies",
             self.base_url,
@@ -203,7 +220,7 @@ impl DepsDevClient {
 
         debug!("Fetching dependency graph: {}", url);
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.get_with_retry(&url).await?;
 
         if response.status().is_success() {
             let graph = response.json::<DependencyGraph>().await?;
@@ -252,9 +269,6 @@ impl DepsDevClient {
     /// # }
     /// ```
     pub async fn get_package(&self, system: System, package: &str) -> Result<Package> {
-        // Apply rate limiting before making request
-        self.rate_limiter.lock().await.wait_if_needed().await;
-
         let url = format!(
             "{}/systems/{}/packages/{}",
             self.base_url,
@@ -264,7 +278,7 @@ impl DepsDevClient {
 
         debug!("Fetching package info: {}", url);
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.get_with_retry(&url).await?;
 
         if response.status().is_success() {
             let package = response.json::<Package>().await?;
@@ -317,6 +331,19 @@ impl DepsDevClient {
     }
 }
 
+/// Parse a `Retry-After` header given in delta-seconds, capped at `MAX_RETRY_AFTER`
+fn retry_after(response: &reqwest::Response) -> Option<Duration> {
+    let secs = response
+        .headers()
+        .get(reqwest::header::RETRY_AFTER)?
+        .to_str()
+        .ok()?
+        .trim()
+        .parse::<u64>()
+        .ok()?;
+    Some(Duration::from_secs(secs).min(MAX_RETRY_AFTER))
+}
+
 impl Default for DepsDevClient {
     fn default() -> Self {
         Self::new()
@@ -327,6 +354,97 @@ impl Default for DepsDevClient {
 mod tests {
     use super::*;
 
+    #[tokio::test]
+    async fn test_retries_after_rate_limit() {
+        use wiremock::matchers::method;
+        use wiremock::{Mock, MockServer, ResponseTemplate};
+
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .respond_with(ResponseTemplate::new(429).insert_header("Retry-After", "0"))
+            .up_to_n_times(1)
+            .expect(1)
+            .mount(&server)
+            .await;
+        Mock::given(method("GET"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "packageKey": {"system": "MAVEN", "name": "com.google.guava:guava"},
+                "versions": ["32.0.0-jre"]
+            })))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let client = DepsDevClient::with_rate_limit(server.uri(), 1000.0);
+        let package = client
+            .get_package(System::Maven, "com.google.guava:guava")
+            .await
+            .unwrap();
+
+        assert_eq!(package.versions, vec!["32.0.0-jre".to_string()]);
+    }
+
+    #[tokio::test]
+    async fn test_rate_limit_gives_up_after_max_retries() {
+        use wiremock::matchers::method;
+        use wiremock::{Mock, MockServer, ResponseTemplate};
+
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .respond_with(ResponseTemplate::new(429).insert_header("Retry-After", "0"))
+            .expect(u64::from(MAX_RATE_LIMIT_RETRIES) + 1)
+            .mount(&server)
+            .await;
+
+        let client = DepsDevClient::with_rate_limit(server.uri(), 1000.0);
+        let result = client
+            .get_package(System::Maven, "com.google.guava:guava")
+            .await;
+
+        assert!(matches!(result, Err(DepsDevError::RateLimited)));
+    }
+
+    #[tokio::test]
+    async fn test_concurrent_requests_have_independent_retry_budgets() {
+        use wiremock::matchers::{method, path_regex};
+        use wiremock::{Mock, MockServer, ResponseTemplate};
+
+        let server = MockServer::start().await;
+        // The first package is always rate limited...
+        Mock::given(method("GET"))
+            .and(path_regex("limited$"))
+            .respond_with(ResponseTemplate::new(429).insert_header("Retry-After", "0"))
+            .expect(u64::from(MAX_RATE_LIMIT_RETRIES) + 1)
+            .mount(&server)
+            .await;
+        // ...while the second is rate limited once and then succeeds
+        Mock::given(method("GET"))
+            .and(path_regex("ok$"))
+            .respond_with(ResponseTemplate::new(429).insert_header("Retry-After", "0"))
+            .up_to_n_times(1)
+            .expect(1)
+            .mount(&server)
+            .await;
+        Mock::given(method("GET"))
+            .and(path_regex("ok$"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "packageKey": {"system": "MAVEN", "name": "com.example:ok"},
+                "versions": ["1.0.0"]
+            })))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let client = DepsDevClient::with_rate_limit(server.uri(), 1000.0);
+        let (limited, ok) = tokio::join!(
+            client.get_package(System::Maven, "com.example:limited"),
+            client.get_package(System::Maven, "com.example:ok"),
+        );
+
+        assert!(matches!(limited, Err(DepsDevError::RateLimited)));
+        assert_eq!(ok.unwrap().versions, vec!["1.0.0".to_string()]);
+    }
+
     #[tokio::test]
     #[ignore] // Requires network access
     async fn test_get_version() {
@@ -15,6 +15,9 @@ pub mod licenses;
 pub mod sarif;
 pub mod spdx;
 
+use std::fs::File;
+use std::io::{BufWriter, Write};
+use std::path::Path;
 use std::str::FromStr;
 
 /// Supported SBOM output formats
@@ -47,3 +50,13 @@ impl OutputFormat {
         }
     }
 }
+
+/// Write a document as pretty-printed JSON through a buffered file writer
+///
+/// Serializes straight to disk so large SBOMs are never rendered into an
+/// intermediate `String` first.
+pub fn write_json_pretty<T: serde::Serialize>(path: &Path, value: &T) -> std::io::Result<()> {
+    let mut writer = BufWriter::new(File::create(path)?);
+    serde_json::to_writer_pretty(&mut writer, value)?;
+    writer.flush()
+}
@@ -69,7 +69,8 @@ pub struct Relationship {
 
 impl SpdxDocument {
     pub fn new(name: impl Into<String>, namespace: impl Into<String>) -> Self {
-        let now = chrono::Utc::now().to_rfc3339();
+        // SPDX requires `YYYY-MM-DDThh:mm:ssZ` (no fractional seconds, `Z` suffix)
+        let now = chrono::Utc::now().to_rfc3339_opts(chrono::SecondsFormat::Secs, true);
         Self {
             spdx_version: SPDX_VERSION.to_string(),
             data_license: DATA_LICENSE.to_string(),
@@ -94,6 +95,19 @@ impl SpdxDocument {
     }
 }
 
+/// Replace every character not allowed in an SPDX identifier (`[A-Za-z0-9.-]`) with `-`
+pub fn sanitize_spdx_id(id: &str) -> String {
+    id.chars()
+        .map(|c| {
+            if c.is_ascii_alphanumeric() || c == '.' || c == '-' {
+                c
+            } else {
+                '-'
+            }
+        })
+        .collect()
+}
+
 impl Package {
     pub fn new(id: impl Into<String>, name: impl Into<String>) -> Self {
         Self {
@@ -168,6 +182,13 @@ mod tests {
         assert_eq!(doc.packages[0].name, "test-package");
     }
 
+    #[test]
+    fn test_sanitize_spdx_id() {
+        assert_eq!(sanitize_spdx_id("commons-io.2"), "commons-io.2");
+        assert_eq!(sanitize_spdx_id("library/nginx:1.25"), "library-nginx-1.25");
+        assert_eq!(sanitize_spdx_id("my_pkg@ü"), "my-pkg--");
+    }
+
     #[test]
     fn test_serialize_to_json() {
         let doc = SpdxDocument::new("test", "https://example.com/test");
@@ -1,10 +1,22 @@
 use bazbom_formats::cyclonedx::CycloneDxBom;
 use bazbom_formats::sarif::SarifReport;
 use bazbom_formats::spdx::SpdxDocument;
+use serde_json::Value;
 use std::fs;
 
 const GOLDEN_DIR: &str = concat!(env!("CARGO_MANIFEST_DIR"), "/tests/golden");
 
+const SPDX_REQUIRED_FIELDS: &[&str] = &[
+    "spdxVersion",
+    "dataLicense",
+    "SPDXID",
+    "name",
+    "documentNamespace",
+    "creationInfo",
+];
+const CYCLONEDX_REQUIRED_FIELDS: &[&str] = &["bomFormat", "specVersion", "version", "metadata"];
+const SARIF_REQUIRED_FIELDS: &[&str] = &["version", "$schema", "runs"];
+
 #[test]
 fn test_spdx_minimal_golden() {
     let golden_path = format!("{}/spdx_minimal.json", GOLDEN_DIR);
@@ -81,25 +93,30 @@ fn test_sarif_minimal_golden() {
         serde_json::from_str(&serialized).expect("Failed to parse round-trip SARIF");
 }
 
+/// Return the keys from `required` that are absent from a JSON object
+fn missing_keys<'a>(value: &Value, required: &[&'a str]) -> Vec<&'a str> {
+    required
+        .iter()
+        .copied()
+        .filter(|key| value.get(key).is_none())
+        .collect()
+}
+
 #[test]
 fn test_spdx_schema_compliance() {
     // Create a document programmatically
     let doc = SpdxDocument::new("test-doc", "https://bazbom.io/test");
 
     // Serialize
-    let json = serde_json::to_string_pretty(&doc).expect("Failed to serialize");
+    let json = serde_json::to_value(&doc).expect("Failed to serialize");
 
     // Verify required fields are present
-    assert!(json.contains("\"spdxVersion\""));
-    assert!(json.contains("\"dataLicense\""));
-    assert!(json.contains("\"SPDXID\""));
-    assert!(json.contains("\"name\""));
-    assert!(json.contains("\"documentNamespace\""));
-    assert!(json.contains("\"creationInfo\""));
+    let missing = missing_keys(&json, SPDX_REQUIRED_FIELDS);
+    assert!(missing.is_empty(), "SPDX missing fields: {:?}", missing);
 
     // Parse back to ensure valid
     let _parsed: SpdxDocument =
-        serde_json::from_str(&json).expect("Failed to parse generated SPDX");
+        serde_json::from_value(json).expect("Failed to parse generated SPDX");
 }
 
 #[test]
@@ -108,17 +125,19 @@ fn test_cyclonedx_schema_compliance() {
     let bom = CycloneDxBom::new("bazbom", "0.0.1-dev");
 
     // Serialize
-    let json = serde_json::to_string_pretty(&bom).expect("Failed to serialize");
+    let json = serde_json::to_value(&bom).expect("Failed to serialize");
 
     // Verify required fields are present
-    assert!(json.contains("\"bomFormat\""));
-    assert!(json.contains("\"specVersion\""));
-    assert!(json.contains("\"version\""));
-    assert!(json.contains("\"metadata\""));
+    let missing = missing_keys(&json, CYCLONEDX_REQUIRED_FIELDS);
+    assert!(
+        missing.is_empty(),
+        "CycloneDX missing fields: {:?}",
+        missing
+    );
 
     // Parse back to ensure valid
     let _parsed: CycloneDxBom =
-        serde_json::from_str(&json).expect("Failed to parse generated CycloneDX");
+        serde_json::from_value(json).expect("Failed to parse generated CycloneDX");
 }
 
 #[test]
@@ -127,37 +146,17 @@ fn test_sarif_schema_compliance() {
     let report = SarifReport::new("bazbom", "0.0.1-dev");
 
     // Serialize
-    let json = serde_json::to_string_pretty(&report).expect("Failed to serialize");
+    let json = serde_json::to_value(&report).expect("Failed to serialize");
 
     // Verify required fields are present
-    assert!(json.contains("\"version\""));
-    assert!(json.contains("\"$schema\""));
-    assert!(json.contains("\"runs\""));
-    assert!(json.contains("\"tool\""));
-    assert!(json.contains("\"driver\""));
+    let missing = missing_keys(&json, SARIF_REQUIRED_FIELDS);
+    assert!(missing.is_empty(), "SARIF missing fields: {:?}", missing);
+    assert!(
+        json["runs"][0]["tool"]["driver"].is_object(),
+        "SARIF run is missing tool.driver"
+    );
 
     // Parse back to ensure valid
     let _parsed: SarifReport =
-        serde_json::from_str(&json).expect("Failed to parse generated SARIF");
-}
-
-#[test]
-fn test_golden_files_are_minimal_valid_schemas() {
-    // This test ensures our golden files are actually minimal valid schemas
-    // that can be parsed and used as reference implementations
-
-    // SPDX
-    let spdx_path = format!("{}/spdx_minimal.json", GOLDEN_DIR);
-    let spdx_content = fs::read_to_string(&spdx_path).unwrap();
-    let _spdx: SpdxDocument = serde_json::from_str(&spdx_content).unwrap();
-
-    // CycloneDX
-    let cdx_path = format!("{}/cyclonedx_minimal.json", GOLDEN_DIR);
-    let cdx_content = fs::read_to_string(&cdx_path).unwrap();
-    let _cdx: CycloneDxBom = serde_json::from_str(&cdx_content).unwrap();
-
-    // SARIF
-    let sarif_path = format!("{}/sarif_minimal.json", GOLDEN_DIR);
-    let sarif_content = fs::read_to_string(&sarif_path).unwrap();
-    let _sarif: SarifReport = serde_json::from_str(&sarif_content).unwrap();
+        serde_json::from_value(json).expect("Failed to parse generated SARIF");
 }
@@ -4,34 +4,55 @@ use bazbom_formats::spdx::{Package, SpdxDocument};
 use jsonschema::Validator;
 use serde_json::Value;
 use std::fs;
+use std::sync::OnceLock;
+
+/// Embed a bundled schema at compile time so tests never touch the filesystem for it
+macro_rules! embedded_schema {
+    ($filename:literal) => {
+        load_schema(
+            $filename,
+            include_bytes!(concat!(
+                env!("CARGO_MANIFEST_DIR"),
+                "/../../tools/supplychain/sbom_schemas/",
+                $filename
+            )),
+        )
+    };
+}
 
-const SCHEMA_DIR: &str = concat!(
-    env!("CARGO_MANIFEST_DIR"),
-    "/../../tools/supplychain/sbom_schemas"
-);
-
-fn load_schema(filename: &str) -> Validator {
-    let schema_path = format!("{}/{}", SCHEMA_DIR, filename);
-    let schema_content = fs::read_to_string(&schema_path)
-        .unwrap_or_else(|_| panic!("Failed to read schema file: {}", schema_path));
-
-    let schema_json: Value = serde_json::from_str(&schema_content)
-        .unwrap_or_else(|e| panic!("Failed to parse schema JSON {}: {}", schema_path, e));
+fn load_schema(filename: &str, schema_content: &[u8]) -> Validator {
+    let schema_json: Value = serde_json::from_slice(schema_content)
+        .unwrap_or_else(|e| panic!("Failed to parse schema JSON {}: {}", filename, e));
 
     Validator::options()
         .build(&schema_json)
         .unwrap_or_else(|e| panic!("Failed to compile schema {}: {}", filename, e))
 }
 
+// Compile each schema once and share the validator across tests in this binary
+
+fn spdx_schema() -> &'static Validator {
+    static SCHEMA: OnceLock<Validator> = OnceLock::new();
+    SCHEMA.get_or_init(|| embedded_schema!("spdx-2.3-schema.json"))
+}
+
+fn cyclonedx_schema() -> &'static Validator {
+    static SCHEMA: OnceLock<Validator> = OnceLock::new();
+    SCHEMA.get_or_init(|| embedded_schema!("cyclonedx-1.5-schema.json"))
+}
+
+fn sarif_schema() -> &'static Validator {
+    static SCHEMA: OnceLock<Validator> = OnceLock::new();
+    SCHEMA.get_or_init(|| embedded_schema!("sarif-2.1.0-schema.json"))
+}
+
 #[test]
 fn test_spdx_output_validates_against_schema() {
-    let schema = load_schema("spdx-2.3-schema.json");
+    let schema = spdx_schema();
 
     let doc = SpdxDocument::new("test-validation", "https://bazbom.io/test-validation");
 
-    let json_str = serde_json::to_string(&doc).expect("Failed to serialize SPDX document");
-    let json_value: Value =
-        serde_json::from_str(&json_str).expect("Failed to parse serialized SPDX");
+    let json_value = serde_json::to_value(&doc).expect("Failed to serialize SPDX document");
 
     if let Err(e) = schema.validate(&json_value) {
         panic!("SPDX validation failed: {}", e);
@@ -40,7 +61,7 @@ fn test_spdx_output_validates_against_schema() {
 
 #[test]
 fn test_spdx_with_package_validates_against_schema() {
-    let schema = load_schema("spdx-2.3-schema.json");
+    let schema = spdx_schema();
 
     let mut doc = SpdxDocument::new("test-with-package", "https://bazbom.io/test-with-package");
 
@@ -51,9 +72,7 @@ fn test_spdx_with_package_validates_against_schema() {
 
     doc.add_package(pkg);
 
-    let json_str = serde_json::to_string(&doc).expect("Failed to serialize SPDX document");
-    let json_value: Value =
-        serde_json::from_str(&json_str).expect("Failed to parse serialized SPDX");
+    let json_value = serde_json::to_value(&doc).expect("Failed to serialize SPDX document");
 
     if let Err(e) = schema.validate(&json_value) {
         panic!("SPDX with package validation failed: {}", e);
@@ -63,13 +82,11 @@ fn test_spdx_with_package_validates_against_schema() {
 #[test]
 #[ignore] // CycloneDX schema requires external schema references (offline mode incompatible)
 fn test_cyclonedx_output_validates_against_schema() {
-    let schema = load_schema("cyclonedx-1.5-schema.json");
+    let schema = cyclonedx_schema();
 
     let bom = CycloneDxBom::new("bazbom", "0.0.1-dev");
 
-    let json_str = serde_json::to_string(&bom).expect("Failed to serialize CycloneDX BOM");
-    let json_value: Value =
-        serde_json::from_str(&json_str).expect("Failed to parse serialized CycloneDX");
+    let json_value = serde_json::to_value(&bom).expect("Failed to serialize CycloneDX BOM");
 
     if let Err(e) = schema.validate(&json_value) {
         panic!("CycloneDX validation failed: {}", e);
@@ -79,7 +96,7 @@ fn test_cyclonedx_output_validates_against_schema() {
 #[test]
 #[ignore] // CycloneDX schema requires external schema references (offline mode incompatible)
 fn test_cyclonedx_with_component_validates_against_schema() {
-    let schema = load_schema("cyclonedx-1.5-schema.json");
+    let schema = cyclonedx_schema();
 
     let mut bom = CycloneDxBom::new("bazbom", "0.0.1-dev");
 
@@ -90,9 +107,7 @@ fn test_cyclonedx_with_component_validates_against_schema() {
 
     bom.add_component(component);
 
-    let json_str = serde_json::to_string(&bom).expect("Failed to serialize CycloneDX BOM");
-    let json_value: Value =
-        serde_json::from_str(&json_str).expect("Failed to parse serialized CycloneDX");
+    let json_value = serde_json::to_value(&bom).expect("Failed to serialize CycloneDX BOM");
 
     if let Err(e) = schema.validate(&json_value) {
         panic!("CycloneDX with component validation failed: {}", e);
@@ -101,13 +116,11 @@ fn test_cyclonedx_with_component_validates_against_schema() {
 
 #[test]
 fn test_sarif_output_validates_against_schema() {
-    let schema = load_schema("sarif-2.1.0-schema.json");
+    let schema = sarif_schema();
 
     let report = SarifReport::new("bazbom", "0.0.1-dev");
 
-    let json_str = serde_json::to_string(&report).expect("Failed to serialize SARIF report");
-    let json_value: Value =
-        serde_json::from_str(&json_str).expect("Failed to parse serialized SARIF");
+    let json_value = serde_json::to_value(&report).expect("Failed to serialize SARIF report");
 
     if let Err(e) = schema.validate(&json_value) {
         panic!("SARIF validation failed: {}", e);
@@ -116,7 +129,7 @@ fn test_sarif_output_validates_against_schema() {
 
 #[test]
 fn test_sarif_with_result_validates_against_schema() {
-    let schema = load_schema("sarif-2.1.0-schema.json");
+    let schema = sarif_schema();
 
     let mut report = SarifReport::new("bazbom", "0.0.1-dev");
 
@@ -134,9 +147,7 @@ fn test_sarif_with_result_validates_against_schema() {
     );
     report.add_result(result);
 
-    let json_str = serde_json::to_string(&report).expect("Failed to serialize SARIF report");
-    let json_value: Value =
-        serde_json::from_str(&json_str).expect("Failed to parse serialized SARIF");
+    let json_value = serde_json::to_value(&report).expect("Failed to serialize SARIF report");
 
     if let Err(e) = schema.validate(&json_value) {
         panic!("SARIF with result validation failed: {}", e);
@@ -145,18 +156,18 @@ fn test_sarif_with_result_validates_against_schema() {
 
 #[test]
 fn test_golden_files_validate_against_schemas() {
-    let spdx_schema = load_schema("spdx-2.3-schema.json");
+    let spdx_schema = spdx_schema();
     // CycloneDX schema requires external references - skip for offline mode
-    // let cyclonedx_schema = load_schema("cyclonedx-1.5-schema.json");
-    let sarif_schema = load_schema("sarif-2.1.0-schema.json");
+    // let cyclonedx_schema = cyclonedx_schema();
+    let sarif_schema = sarif_schema();
 
     let golden_dir = concat!(env!("CARGO_MANIFEST_DIR"), "/tests/golden");
 
     // Validate SPDX golden file
     let spdx_path = format!("{}/spdx_minimal.json", golden_dir);
-    let spdx_content = fs::read_to_string(&spdx_path).expect("Failed to read SPDX golden file");
+    let spdx_content = fs::read(&spdx_path).expect("Failed to read SPDX golden file");
     let spdx_json: Value =
-        serde_json::from_str(&spdx_content).expect("Failed to parse SPDX golden file");
+        serde_json::from_slice(&spdx_content).expect("Failed to parse SPDX golden file");
 
     if let Err(e) = spdx_schema.validate(&spdx_json) {
         panic!("SPDX golden file validation failed: {}", e);
@@ -177,9 +188,9 @@ fn test_golden_files_validate_against_schemas() {
 
     // Validate SARIF golden file
     let sarif_path = format!("{}/sarif_minimal.json", golden_dir);
-    let sarif_content = fs::read_to_string(&sarif_path).expect("Failed to read SARIF golden file");
+    let sarif_content = fs::read(&sarif_path).expect("Failed to read SARIF golden file");
     let sarif_json: Value =
-        serde_json::from_str(&sarif_content).expect("Failed to parse SARIF golden file");
+        serde_json::from_slice(&sarif_content).expect("Failed to parse SARIF golden file");
 
     if let Err(e) = sarif_schema.validate(&sarif_json) {
         panic!("SARIF golden file validation failed: {}", e);
@@ -14,6 +14,24 @@ fn test_spdx_document_creation() {
     assert!(doc.relationships.is_empty());
 }
 
+#[test]
+fn test_spdx_created_timestamp_format() {
+    let doc = SpdxDocument::new("test-sbom", "https://example.com/sbom/test");
+    let created = &doc.creation_info.created;
+
+    // SPDX 2.3 requires YYYY-MM-DDThh:mm:ssZ
+    let shape = b"dddd-dd-ddTdd:dd:ddZ";
+    let matches = created.len() == shape.len()
+        && created.bytes().zip(shape).all(|(c, &s)| {
+            if s == b'd' {
+                c.is_ascii_digit()
+            } else {
+                c == s
+            }
+        });
+    assert!(matches, "unexpected creation timestamp: {}", created);
+}
+
 #[test]
 fn test_spdx_package_creation() {
     let pkg = Package::new("pkg1", "example-package")
@@ -3,7 +3,9 @@
 use crate::checksum_fetcher;
 use crate::types::{EcosystemScanResult, Package};
 use anyhow::Result;
+use bazbom_formats::spdx::sanitize_spdx_id;
 use serde_json::json;
+use std::collections::HashSet;
 
 /// Generate a unified SPDX SBOM from multiple ecosystem scan results
 pub async fn generate_polyglot_sbom(
@@ -12,6 +14,7 @@ pub async fn generate_polyglot_sbom(
 ) -> Result<serde_json::Value> {
     let mut all_packages = Vec::new();
     let mut total_packages = 0;
+    let mut seen = HashSet::new();
 
     // Create HTTP client if checksum fetching is enabled
     let client = if fetch_checksums {
@@ -23,14 +26,23 @@ pub async fn generate_polyglot_sbom(
     // Collect all packages from all ecosystems
     for result in results {
         for package in &result.packages {
+            // The same package can be reported more than once (e.g. via a
+            // shared transitive dependency); emit it, and fetch its checksum,
+            // only once per SPDXID.
+            let spdx_id = spdx_package_id(package);
+            if seen.contains(&spdx_id) {
+                continue;
+            }
+
             let pkg_json = if let Some(ref http_client) = client {
                 // Fetch checksum if enabled
-                create_spdx_package_with_checksum(package, http_client).await
+                create_spdx_package_with_checksum(package, &spdx_id, http_client).await
             } else {
-                create_spdx_package(package)
+                create_spdx_package(package, &spdx_id)
             };
 
             all_packages.push(pkg_json);
+            seen.insert(spdx_id);
             total_packages += 1;
         }
     }
@@ -43,7 +55,7 @@ pub async fn generate_polyglot_sbom(
         "name": "Polyglot SBOM",
         "documentNamespace": format!("https://bazbom.dev/sbom/{}", uuid::Uuid::new_v4()),
         "creationInfo": {
-            "created": chrono::Utc::now().to_rfc3339(),
+            "created": chrono::Utc::now().to_rfc3339_opts(chrono::SecondsFormat::Secs, true),
             "creators": ["Tool: BazBOM"],
             "licenseListVersion": "3.21"
         },
@@ -56,14 +68,18 @@ pub async fn generate_polyglot_sbom(
     Ok(sbom)
 }
 
-/// Create SPDX package entry (without checksum fetching)
-fn create_spdx_package(package: &Package) -> serde_json::Value {
-    let spdx_id = format!(
-        "SPDXRef-Package-{}-{}",
-        sanitize_for_spdx_id(&package.name),
-        sanitize_for_spdx_id(&package.version)
-    );
+/// SPDXID for a package, derived from its PURL so that packages with the
+/// same name and version in different ecosystems or namespaces stay distinct
+fn spdx_package_id(package: &Package) -> String {
+    let purl = package.purl();
+    format!(
+        "SPDXRef-Package-{}",
+        sanitize_spdx_id(purl.strip_prefix("pkg:").unwrap_or(&purl))
+    )
+}
 
+/// Create SPDX package entry (without checksum fetching)
+fn create_spdx_package(package: &Package, spdx_id: &str) -> serde_json::Value {
     // Get download location from ecosystem registry if available
     let download_location = package
         .download_url()
@@ -75,8 +91,8 @@ fn create_spdx_package(package: &Package) -> serde_json::Value {
         "versionInfo": package.version,
         "downloadLocation": download_location,
         "filesAnalyzed": false,
-        "licenseConcluded": package.license.as_ref().unwrap_or(&"NOASSERTION".to_string()),
-        "licenseDeclared": package.license.as_ref().unwrap_or(&"NOASSERTION".to_string()),
+        "licenseConcluded": package.license.as_deref().unwrap_or("NOASSERTION"),
+        "licenseDeclared": package.license.as_deref().unwrap_or("NOASSERTION"),
         "copyrightText": "NOASSERTION",
         "checksums": null,
         "externalRefs": [{
@@ -84,8 +100,8 @@ fn create_spdx_package(package: &Package) -> serde_json::Value {
             "referenceType": "purl",
             "referenceLocator": package.purl()
         }],
-        "description": package.description.as_ref().unwrap_or(&"".to_string()),
-        "homepage": package.homepage.as_ref().unwrap_or(&"".to_string()),
+        "description": package.description.as_deref().unwrap_or(""),
+        "homepage": package.homepage.as_deref().unwrap_or(""),
         "comment": format!("Ecosystem: {}", package.ecosystem)
     })
 }
@@ -93,14 +109,9 @@ fn create_spdx_package(package: &Package) -> serde_json::Value {
 /// Create SPDX package entry WITH checksum fetching
 async fn create_spdx_package_with_checksum(
     package: &Package,
+    spdx_id: &str,
     client: &reqwest::Client,
 ) -> serde_json::Value {
-    let spdx_id = format!(
-        "SPDXRef-Package-{}-{}",
-        sanitize_for_spdx_id(&package.name),
-        sanitize_for_spdx_id(&package.version)
-    );
-
     // Get download location from ecosystem registry if available
     let download_location = package
         .download_url()
@@ -131,8 +142,8 @@ async fn create_spdx_package_with_checksum(
         "versionInfo": package.version,
         "downloadLocation": download_location,
         "filesAnalyzed": false,
-        "licenseConcluded": package.license.as_ref().unwrap_or(&"NOASSERTION".to_string()),
-        "licenseDeclared": package.license.as_ref().unwrap_or(&"NOASSERTION".to_string()),
+        "licenseConcluded": package.license.as_deref().unwrap_or("NOASSERTION"),
+        "licenseDeclared": package.license.as_deref().unwrap_or("NOASSERTION"),
         "copyrightText": "NOASSERTION",
         "checksums": checksums,
         "externalRefs": [{
@@ -140,8 +151,8 @@ async fn create_spdx_package_with_checksum(
             "referenceType": "purl",
             "referenceLocator": package.purl()
         }],
-        "description": package.description.as_ref().unwrap_or(&"".to_string()),
-        "homepage": package.homepage.as_ref().unwrap_or(&"".to_string()),
+        "description": package.description.as_deref().unwrap_or(""),
+        "homepage": package.homepage.as_deref().unwrap_or(""),
         "comment": format!("Ecosystem: {}", package.ecosystem)
     })
 }
@@ -164,19 +175,6 @@ fn generate_relationships(packages: &[serde_json::Value]) -> Vec<serde_json::Val
     relationships
 }
 
-/// Sanitize string for use in SPDX ID (alphanumeric, hyphen, dot only)
-fn sanitize_for_spdx_id(s: &str) -> String {
-    s.chars()
-        .map(|c| {
-            if c.is_alphanumeric() || c == '-' || c == '.' {
-                c
-            } else {
-                '-'
-            }
-        })
-        .collect()
-}
-
 /// Generate GitHub dependency snapshot format
 pub fn generate_github_snapshot(
     results: &[EcosystemScanResult],
@@ -413,17 +411,83 @@ pub fn spdx_json_to_tag_value(spdx_json: &serde_json::Value) -> Result<String> {
 mod tests {
     use super::*;
 
-    #[test]
-    fn test_sanitize_for_spdx_id() {
-        assert_eq!(sanitize_for_spdx_id("@types/node"), "-types-node");
-        assert_eq!(sanitize_for_spdx_id("express"), "express");
-        assert_eq!(sanitize_for_spdx_id("1.2.3"), "1.2.3");
-    }
-
     #[tokio::test]
     async fn test_generate_polyglot_sbom_no_checksums() {
         let results = vec![];
         let sbom = generate_polyglot_sbom(&results, false).await.unwrap();
         assert_eq!(sbom["spdxVersion"], "SPDX-2.3");
+
+        // SPDX 2.3 requires YYYY-MM-DDThh:mm:ssZ
+        let created = sbom["creationInfo"]["created"].as_str().unwrap();
+        let shape = b"dddd-dd-ddTdd:dd:ddZ";
+        let matches = created.len() == shape.len()
+            && created.bytes().zip(shape).all(|(c, &s)| {
+                if s == b'd' {
+                    c.is_ascii_digit()
+                } else {
+                    c == s
+                }
+            });
+        assert!(matches, "unexpected creation timestamp: {}", created);
+    }
+
+    #[tokio::test]
+    async fn test_generate_polyglot_sbom_dedupes_packages() {
+        let package = Package {
+            name: "express".to_string(),
+            version: "4.18.2".to_string(),
+            ecosystem: "npm".to_string(),
+            namespace: None,
+            dependencies: Vec::new(),
+            license: None,
+            description: None,
+            homepage: None,
+            repository: None,
+        };
+        let mut result = EcosystemScanResult::new("npm".to_string(), ".".to_string());
+        result.add_package(package.clone());
+        result.add_package(package);
+
+        let sbom = generate_polyglot_sbom(&[result], false).await.unwrap();
+        assert_eq!(sbom["packages"].as_array().unwrap().len(), 1);
+        assert_eq!(sbom["relationships"].as_array().unwrap().len(), 1);
+        assert_eq!(
+            sbom["packages"][0]["SPDXID"],
+            "SPDXRef-Package-npm-express-4.18.2"
+        );
+    }
+
+    #[tokio::test]
+    async fn test_generate_polyglot_sbom_keeps_same_name_across_ecosystems() {
+        let package = |ecosystem: &str| Package {
+            name: "requests".to_string(),
+            version: "2.31.0".to_string(),
+            ecosystem: ecosystem.to_string(),
+            namespace: None,
+            dependencies: Vec::new(),
+            license: None,
+            description: None,
+            homepage: None,
+            repository: None,
+        };
+        let mut npm = EcosystemScanResult::new("npm".to_string(), ".".to_string());
+        npm.add_package(package("npm"));
+        let mut pypi = EcosystemScanResult::new("Python".to_string(), ".".to_string());
+        pypi.add_package(package("Python"));
+
+        let sbom = generate_polyglot_sbom(&[npm, pypi], false).await.unwrap();
+        let ids: Vec<&str> = sbom["packages"]
+            .as_array()
+            .unwrap()
+            .iter()
+            .map(|p| p["SPDXID"].as_str().unwrap())
+            .collect();
+        assert_eq!(
+            ids,
+            vec![
+                "SPDXRef-Package-npm-requests-2.31.0",
+                "SPDXRef-Package-pypi-requests-2.31.0"
+            ]
+        );
     }
 }
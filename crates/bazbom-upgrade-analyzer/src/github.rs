@@ -4,6 +4,22 @@ use octocrab::Octocrab;
 use regex::Regex;
 use tracing::{debug, warn};
 
+lazy_static::lazy_static! {
+    /// Matches https://github.com/owner/repo and git@github.com:owner/repo.git
+    static ref REPO_URL_PATTERN: Regex = Regex::new(r"github\.com[:/]([^/]+)/([^/\.]+)").unwrap();
+
+    /// Header that opens a breaking changes section ("## Breaking", "# Breaking Changes:")
+    static ref BREAKING_HEADER_PATTERN: Regex =
+        Regex::new(r"(?i)^#+\s*breaking(?:\s+changes?:?)?\s*$").unwrap();
+
+    /// Inline breaking change markers; group 1 is the description
+    static ref INLINE_BREAKING_PATTERNS: [Regex; 2] = [
+        Regex::new(r"(?i)\*\*breaking\*\*:?\s*(.+)").unwrap(),
+        // Warning sign (U+26A0, optional emoji presentation selector) or collision (U+1F4A5)
+        Regex::new(r"(?:\x{26A0}\x{FE0F}?|\x{1F4A5})\s*(.+)").unwrap(),
+    ];
+}
+
 /// GitHub release notes analyzer
 pub struct GitHubAnalyzer {
     client: Octocrab,
@@ -18,8 +34,7 @@ impl GitHubAnalyzer {
     /// Parse owner and repo from GitHub URL
     fn parse_repo_url(&self, url: &str) -> Option<(String, String)> {
         // Match: https://github.com/owner/repo or git@github.com:owner/repo.git
-        let re = Regex::new(r"github\.com[:/]([^/]+)/([^/\.]+)").ok()?;
-        let caps = re.captures(url)?;
+        let caps = REPO_URL_PATTERN.captures(url)?;
         Some((caps[1].to_string(), caps[2].to_string()))
     }
 
@@ -90,36 +105,39 @@ impl GitHubAnalyzer {
 
     /// Extract breaking changes from release notes
     fn extract_breaking_changes(&self, version: &str, body: &str) -> Vec<BreakingChange> {
-        let mut changes = Vec::new();
+        // Headers and **breaking** markers all contain the word; skip those
+        // regexes entirely for release notes that never mention it
+        let mentions_breaking = body
+            .as_bytes()
+            .windows(b"breaking".len())
+            .any(|window| window.eq_ignore_ascii_case(b"breaking"));
+        self.parse_breaking_changes(version, body, mentions_breaking)
+    }
 
-        // Patterns for common breaking change markers
-        let patterns = [
-            Regex::new(r"(?im)^#+\s*breaking\s+change[s]?:?\s*$").unwrap(),
-            Regex::new(r"(?im)^#+\s*breaking\s*$").unwrap(),
-            Regex::new(r"(?i)breaking change[s]?:").unwrap(),
-            Regex::new(r"(?i)\*\*breaking\*\*:?\s*(.+)").unwrap(),
-            Regex::new(r"(?i)[WARN💥]\s*(.+)").unwrap(),
-        ];
+    /// Scan release notes for breaking changes, only trying the patterns that
+    /// need the word "breaking" when `mentions_breaking` is set
+    fn parse_breaking_changes(
+        &self,
+        version: &str,
+        body: &str,
+        mentions_breaking: bool,
+    ) -> Vec<BreakingChange> {
+        let mut changes = Vec::new();
 
-        // Split body into lines
-        let lines: Vec<&str> = body.lines().collect();
-        let mut i = 0;
+        let inline_patterns = if mentions_breaking {
+            &INLINE_BREAKING_PATTERNS[..]
+        } else {
+            &INLINE_BREAKING_PATTERNS[1..]
+        };
 
-        while i < lines.len() {
-            let line = lines[i].trim();
+        let mut lines = body.lines().map(str::trim).peekable();
 
+        while let Some(line) = lines.next() {
             // Check if this line starts a breaking changes section
-            if patterns[0].is_match(line) || patterns[1].is_match(line) {
-                // Next lines until next header are breaking changes
-                i += 1;
-                while i < lines.len() {
-                    let content = lines[i].trim();
-
-                    // Stop at next markdown header
-                    if content.starts_with('#') {
-                        break;
-                    }
-
+            if mentions_breaking && BREAKING_HEADER_PATTERN.is_match(line) {
+                // Next lines until next header are breaking changes; the
+                // header itself is left for the outer loop to examine
+                while let Some(content) = lines.next_if(|content| !content.starts_with('#')) {
                     // Extract bullet points or numbered items
                     if content.starts_with('-')
                         || content.starts_with('*')
@@ -143,28 +161,23 @@ impl GitHubAnalyzer {
                             });
                         }
                     }
-
-                    i += 1;
                 }
             } else {
                 // Check for inline breaking change markers
-                for pattern in &patterns[2..] {
+                for pattern in inline_patterns {
                     if let Some(caps) = pattern.captures(line) {
-                        if caps.len() > 1 {
-                            let description = caps[1].trim().to_string();
-                            if !description.is_empty() {
-                                changes.push(BreakingChange {
-                                    description,
-                                    version: version.to_string(),
-                                    auto_fixable: false,
-                                    affected_apis: vec![],
-                                    migration_hint: None,
-                                });
-                            }
+                        let description = caps[1].trim().to_string();
+                        if !description.is_empty() {
+                            changes.push(BreakingChange {
+                                description,
+                                version: version.to_string(),
+                                auto_fixable: false,
+                                affected_apis: vec![],
+                                migration_hint: None,
+                            });
                         }
                     }
                 }
-                i += 1;
             }
         }
 
@@ -274,4 +287,53 @@ mod tests {
             .description
             .contains("Changed signature of method Y"));
     }
+
+    #[tokio::test]
+    async fn test_extract_breaking_changes_consecutive_sections() {
+        init_crypto();
+        let analyzer = GitHubAnalyzer::default();
+
+        let body = "## Breaking\n- Dropped Java 8\n## Breaking Changes\n1. Renamed config key\n";
+
+        let changes = analyzer.extract_breaking_changes("3.0.0", body);
+        assert_eq!(changes.len(), 2);
+        assert_eq!(changes[0].description, "Dropped Java 8");
+        assert_eq!(changes[1].description, "Renamed config key");
+    }
+
+    #[tokio::test]
+    async fn test_extract_breaking_changes_without_breaking_marker() {
+        init_crypto();
+        let analyzer = GitHubAnalyzer::default();
+
+        let body = "# Changes\n- Bumped dependencies\n- Warn on unknown flags\n\
+                    \u{26A0}\u{FE0F} Dropped the legacy CLI\n\u{1F4A5} Renamed config key\n";
+
+        let expected = vec![
+            BreakingChange {
+                description: "Dropped the legacy CLI".to_string(),
+                version: "1.1.0".to_string(),
+                auto_fixable: false,
+                affected_apis: vec![],
+                migration_hint: None,
+            },
+            BreakingChange {
+                description: "Renamed config key".to_string(),
+                version: "1.1.0".to_string(),
+                auto_fixable: false,
+                affected_apis: vec![],
+                migration_hint: None,
+            },
+        ];
+        assert_eq!(analyzer.extract_breaking_changes("1.1.0", body), expected);
+        // Skipping the "breaking" patterns must not change the result
+        assert_eq!(
+            analyzer.parse_breaking_changes("1.1.0", body, true),
+            expected
+        );
+
+        let with_marker = format!("{}**BREAKING**: Removed foo\n", body);
+        let marked = analyzer.extract_breaking_changes("1.1.0", &with_marker);
+        assert!(marked.iter().any(|c| c.description == "Removed foo"));
+    }
 }
@@ -37,7 +37,7 @@ impl fmt::Display for RiskLevel {
 }
 
 /// A single breaking change
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
 pub struct BreakingChange {
     pub description: String,
     pub version: String,
@@ -55,17 +55,17 @@ pub fn get_alpine_upgrade_recommendations(
     };
 
     // Group advisories by package
-    let mut pkg_advisories: HashMap<String, Vec<&bazbom_alpine::AlpineAdvisory>> = HashMap::new();
+    let mut pkg_advisories: HashMap<&str, Vec<&bazbom_alpine::AlpineAdvisory>> = HashMap::new();
     for advisory in &advisories {
         pkg_advisories
-            .entry(advisory.package.clone())
+            .entry(advisory.package.as_str())
             .or_default()
             .push(advisory);
     }
 
     // Check each installed package
     for (pkg_name, installed_version) in packages {
-        if let Some(advisories) = pkg_advisories.get(pkg_name) {
+        if let Some(advisories) = pkg_advisories.get(pkg_name.as_str()) {
             let mut cves_to_fix = Vec::new();
             let mut max_fixed_version: Option<String> = None;
 
@@ -269,41 +269,27 @@ fn calculate_version_risk(installed: &str, recommended: Option<&str>) -> OsUpgra
         return OsUpgradeRisk::NoFix;
     };
 
-    // Simple heuristic: check major version change
-    let installed_major = extract_major_version(installed);
-    let recommended_major = extract_major_version(recommended);
+    // Simple heuristic: compare major, then minor version
+    let (installed_major, installed_minor) = extract_major_minor_version(installed);
+    let (recommended_major, recommended_minor) = extract_major_minor_version(recommended);
 
     if installed_major != recommended_major {
         OsUpgradeRisk::High
+    } else if installed_minor != recommended_minor {
+        OsUpgradeRisk::Medium
     } else {
-        // Check minor version
-        let installed_minor = extract_minor_version(installed);
-        let recommended_minor = extract_minor_version(recommended);
-
-        if installed_minor != recommended_minor {
-            OsUpgradeRisk::Medium
-        } else {
-            OsUpgradeRisk::Low
-        }
+        OsUpgradeRisk::Low
     }
 }
 
-/// Extract major version number
-fn extract_major_version(version: &str) -> u64 {
-    version
-        .split(&['.', '-', ':'][..])
-        .next()
-        .and_then(|s| s.parse().ok())
-        .unwrap_or(0)
-}
-
-/// Extract minor version number
-fn extract_minor_version(version: &str) -> u64 {
-    version
+/// Extract major and minor version numbers in a single pass over the string
+fn extract_major_minor_version(version: &str) -> (u64, u64) {
+    let mut parts = version
         .split(&['.', '-', ':'][..])
-        .nth(1)
-        .and_then(|s| s.parse().ok())
-        .unwrap_or(0)
+        .map(|s| s.parse().unwrap_or(0));
+    let major = parts.next().unwrap_or(0);
+    let minor = parts.next().unwrap_or(0);
+    (major, minor)
 }
 
 /// Extract version from RPM package string like "openssl-1.0.2k-25.el7_9"
@@ -346,6 +332,15 @@ mod tests {
         assert_eq!(calculate_version_risk("1.2.3", None), OsUpgradeRisk::NoFix);
     }
 
+    #[test]
+    fn test_extract_major_minor_version() {
+        assert_eq!(extract_major_minor_version("1.2.3"), (1, 2));
+        assert_eq!(extract_major_minor_version("1.0.2k-25.el7_9"), (1, 0));
+        assert_eq!(extract_major_minor_version("2:1.1.1n-0+deb11u5"), (2, 1));
+        assert_eq!(extract_major_minor_version("3"), (3, 0));
+        assert_eq!(extract_major_minor_version(""), (0, 0));
+    }
+
     #[test]
     fn test_extract_rpm_version() {
         assert_eq!(
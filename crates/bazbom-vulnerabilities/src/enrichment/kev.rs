@@ -40,12 +40,12 @@ pub struct KevVulnerability {
 
 /// Load KEV catalog from a JSON file and return a map of CVE ID to KEV entry
 pub fn load_kev_catalog<P: AsRef<Path>>(path: P) -> Result<HashMap<String, KevEntry>> {
-    let contents = fs::read_to_string(path.as_ref()).context("Failed to read KEV catalog file")?;
+    let contents = fs::read(path.as_ref()).context("Failed to read KEV catalog file")?;
 
     let catalog: KevCatalog =
-        serde_json::from_str(&contents).context("Failed to parse KEV catalog JSON")?;
+        serde_json::from_slice(&contents).context("Failed to parse KEV catalog JSON")?;
 
-    let mut kev_map = HashMap::new();
+    let mut kev_map = HashMap::with_capacity(catalog.vulnerabilities.len());
 
     for vuln in catalog.vulnerabilities {
         let entry = KevEntry {
@@ -3,6 +3,7 @@
 //! Implements OpenVEX format for documenting vulnerability exploitability.
 
 use anyhow::{Context, Result};
+use rayon::prelude::*;
 use serde::{Deserialize, Serialize};
 use std::collections::{HashMap, HashSet};
 use std::path::Path;
@@ -74,6 +75,34 @@ impl std::fmt::Display for VexStatus {
     }
 }
 
+impl VexStatus {
+    /// Every status, in the order they are listed to users
+    pub const ALL: [VexStatus; 4] = [
+        VexStatus::NotAffected,
+        VexStatus::Affected,
+        VexStatus::Fixed,
+        VexStatus::UnderInvestigation,
+    ];
+}
+
+impl std::str::FromStr for VexStatus {
+    type Err = String;
+
+    fn from_str(s: &str) -> std::result::Result<Self, Self::Err> {
+        match s.to_lowercase().as_str() {
+            "not_affected" | "notaffected" => Ok(VexStatus::NotAffected),
+            "affected" => Ok(VexStatus::Affected),
+            "fixed" => Ok(VexStatus::Fixed),
+            "under_investigation" | "underinvestigation" => Ok(VexStatus::UnderInvestigation),
+            _ => Err(format!(
+                "Invalid status '{}'. Valid values: {}",
+                s,
+                join_names(&VexStatus::ALL)
+            )),
+        }
+    }
+}
+
 /// VEX Justification (for not_affected status)
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 #[serde(rename_all = "snake_case")]
@@ -103,6 +132,43 @@ impl std::fmt::Display for VexJustification {
     }
 }
 
+impl VexJustification {
+    /// Every justification, in the order they are listed to users
+    pub const ALL: [VexJustification; 5] = [
+        VexJustification::ComponentNotPresent,
+        VexJustification::VulnerableCodeNotPresent,
+        VexJustification::VulnerableCodeNotInExecutePath,
+        VexJustification::VulnerableCodeCannotBeControlledByAdversary,
+        VexJustification::InlineMitigationsAlreadyExist,
+    ];
+}
+
+impl std::str::FromStr for VexJustification {
+    type Err = String;
+
+    fn from_str(s: &str) -> std::result::Result<Self, Self::Err> {
+        let lower = s.to_lowercase();
+        VexJustification::ALL
+            .into_iter()
+            .find(|j| j.to_string() == lower)
+            .ok_or_else(|| {
+                format!(
+                    "Invalid justification '{}'. Valid values: {}",
+                    s,
+                    join_names(&VexJustification::ALL)
+                )
+            })
+    }
+}
+
+fn join_names<T: std::fmt::Display>(values: &[T]) -> String {
+    values
+        .iter()
+        .map(ToString::to_string)
+        .collect::<Vec<_>>()
+        .join(", ")
+}
+
 impl VexDocument {
     /// Create a new VEX document
     pub fn new(id: &str, author: &str) -> Self {
@@ -123,9 +189,9 @@ impl VexDocument {
 
     /// Load VEX document from file
     pub fn load(path: &Path) -> Result<Self> {
-        let content = std::fs::read_to_string(path)
+        let content = std::fs::read(path)
             .with_context(|| format!("Failed to read VEX file: {}", path.display()))?;
-        serde_json::from_str(&content)
+        serde_json::from_slice(&content)
             .with_context(|| format!("Failed to parse VEX file: {}", path.display()))
     }
 
@@ -138,25 +204,30 @@ impl VexDocument {
 
     /// Load all VEX documents from a directory
     pub fn load_all(dir: &Path) -> Result<Vec<Self>> {
-        let mut documents = Vec::new();
-
         if !dir.exists() {
-            return Ok(documents);
+            return Ok(Vec::new());
         }
 
+        let mut paths = Vec::new();
         for entry in std::fs::read_dir(dir)? {
-            let entry = entry?;
-            let path = entry.path();
+            let path = entry?.path();
             if path.extension().is_some_and(|ext| ext == "json") {
-                match Self::load(&path) {
-                    Ok(doc) => documents.push(doc),
-                    Err(e) => {
-                        tracing::warn!("Failed to load VEX file {}: {}", path.display(), e);
-                    }
-                }
+                paths.push(path);
             }
         }
 
+        // Read and parse files in parallel; collect keeps directory order
+        let documents = paths
+            .par_iter()
+            .filter_map(|path| match Self::load(path) {
+                Ok(doc) => Some(doc),
+                Err(e) => {
+                    tracing::warn!("Failed to load VEX file {}: {}", path.display(), e);
+                    None
+                }
+            })
+            .collect();
+
         Ok(documents)
     }
 }
@@ -382,6 +453,56 @@ mod tests {
         assert!(!filter.should_suppress("CVE-2023-22222", None));
     }
 
+    #[test]
+    fn test_vex_status_names() {
+        let cases = [
+            (VexStatus::NotAffected, "not_affected"),
+            (VexStatus::Affected, "affected"),
+            (VexStatus::Fixed, "fixed"),
+            (VexStatus::UnderInvestigation, "under_investigation"),
+        ];
+
+        for (status, name) in cases {
+            assert_eq!(status.to_string(), name, "Display for {:?}", status);
+            assert_eq!(
+                serde_json::to_value(status).unwrap(),
+                name,
+                "serialized name for {:?}",
+                status
+            );
+            let parsed: VexStatus = serde_json::from_value(serde_json::json!(name)).unwrap();
+            assert_eq!(parsed, status, "deserialized {:?}", name);
+        }
+    }
+
+    #[test]
+    fn test_vex_status_from_str() {
+        for status in VexStatus::ALL {
+            assert_eq!(status.to_string().parse::<VexStatus>(), Ok(status));
+        }
+        assert_eq!(
+            "NotAffected".parse::<VexStatus>(),
+            Ok(VexStatus::NotAffected)
+        );
+
+        let err = "bogus".parse::<VexStatus>().unwrap_err();
+        assert_eq!(
+            err,
+            "Invalid status 'bogus'. Valid values: not_affected, affected, fixed, under_investigation"
+        );
+    }
+
+    #[test]
+    fn test_vex_justification_from_str() {
+        for justification in VexJustification::ALL {
+            assert_eq!(
+                justification.to_string().parse::<VexJustification>(),
+                Ok(justification)
+            );
+        }
+        assert!("not_a_reason".parse::<VexJustification>().is_err());
+    }
+
     #[test]
     fn test_vex_serialization() {
         let doc = VexDocument::new("test-id", "test@example.com");
@@ -391,4 +512,27 @@ mod tests {
         assert!(json.contains("\"@id\""));
         assert!(json.contains("openvex.dev"));
     }
+
+    #[test]
+    fn test_vex_load_all() {
+        let dir = tempfile::tempdir().unwrap();
+
+        for cve in ["CVE-2023-0001", "CVE-2023-0002"] {
+            let mut doc = VexDocument::new(cve, "test@example.com");
+            doc.add_statement(VexStatement::new(cve, VexStatus::NotAffected));
+            doc.save(&dir.path().join(format!("{}.json", cve))).unwrap();
+        }
+        std::fs::write(dir.path().join("broken.json"), "{not json").unwrap();
+        std::fs::write(dir.path().join("notes.txt"), "ignored").unwrap();
+
+        let documents = VexDocument::load_all(dir.path()).unwrap();
+        assert_eq!(documents.len(), 2);
+
+        let filter = VexFilter::from_documents(&documents);
+        assert!(filter.should_suppress("CVE-2023-0001", None));
+        assert!(filter.should_suppress("CVE-2023-0002", None));
+
+        let missing = VexDocument::load_all(&dir.path().join("missing")).unwrap();
+        assert!(missing.is_empty());
+    }
 }
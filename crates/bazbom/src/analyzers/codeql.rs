@@ -158,9 +158,9 @@ impl CodeqlAnalyzer {
 
         // Read the generated SARIF file
         let sarif_content =
-            std::fs::read_to_string(&output_path).context("failed to read CodeQL SARIF output")?;
-        let report: SarifReport =
-            serde_json::from_str(&sarif_content).context("failed to parse CodeQL SARIF output")?;
+            std::fs::read(&output_path).context("failed to read CodeQL SARIF output")?;
+        let report: SarifReport = serde_json::from_slice(&sarif_content)
+            .context("failed to parse CodeQL SARIF output")?;
 
         println!(
             "[bazbom] CodeQL analysis complete, wrote findings to {:?}",
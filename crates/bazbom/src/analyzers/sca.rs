@@ -85,14 +85,15 @@ impl ScaAnalyzer {
         }
 
         println!("[bazbom] parsing SBOM from {:?}", spdx_path);
-        let content = std::fs::read_to_string(&spdx_path).context("failed to read SPDX file")?;
+        let content = std::fs::read(&spdx_path).context("failed to read SPDX file")?;
 
         let doc: serde_json::Value =
-            serde_json::from_str(&content).context("failed to parse SPDX JSON")?;
+            serde_json::from_slice(&content).context("failed to parse SPDX JSON")?;
 
         let mut components = Vec::new();
 
         if let Some(packages) = doc["packages"].as_array() {
+            components.reserve(packages.len());
             for pkg in packages {
                 let name = pkg["name"].as_str().unwrap_or("unknown").to_string();
                 let version = pkg["versionInfo"].as_str().unwrap_or("").to_string();
@@ -125,11 +126,12 @@ impl ScaAnalyzer {
                     purl = format!("pkg:maven/{}@{}", name.replace('.', "/"), version);
                 }
 
+                let location = format!("{}@{}", name, version);
                 components.push(Component {
-                    name: name.clone(),
-                    version: version.clone(),
+                    name,
+                    version,
                     ecosystem,
-                    location: format!("{}@{}", name, version),
+                    location,
                     purl,
                 });
             }
@@ -477,10 +479,10 @@ impl ScaAnalyzer {
             return Ok(());
         }
 
-        let content = std::fs::read_to_string(&polyglot_sbom_path)
-            .context("Failed to read polyglot-sbom.json")?;
+        let content =
+            std::fs::read(&polyglot_sbom_path).context("Failed to read polyglot-sbom.json")?;
         let sbom: serde_json::Value =
-            serde_json::from_str(&content).context("Failed to parse polyglot-sbom.json")?;
+            serde_json::from_slice(&content).context("Failed to parse polyglot-sbom.json")?;
 
         // Extract reachability data from ecosystems
         let mut reachability_map: std::collections::HashMap<String, bool> =
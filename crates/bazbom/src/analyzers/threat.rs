@@ -87,14 +87,15 @@ impl ThreatAnalyzer {
             "[bazbom] loading SBOM for threat analysis from {:?}",
             spdx_path
         );
-        let content = std::fs::read_to_string(&spdx_path).context("failed to read SPDX file")?;
+        let content = std::fs::read(&spdx_path).context("failed to read SPDX file")?;
 
         let doc: serde_json::Value =
-            serde_json::from_str(&content).context("failed to parse SPDX JSON")?;
+            serde_json::from_slice(&content).context("failed to parse SPDX JSON")?;
 
         let mut components = Vec::new();
 
         if let Some(packages) = doc["packages"].as_array() {
+            components.reserve(packages.len());
             for pkg in packages {
                 let name = pkg["name"].as_str().unwrap_or("unknown").to_string();
                 let version = pkg["versionInfo"].as_str().unwrap_or("").to_string();
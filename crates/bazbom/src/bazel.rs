@@ -54,18 +54,21 @@ impl BazelDependencyGraph {
             project_name
         );
         let mut doc = SpdxDocument::new(format!("{}-sbom", project_name), namespace);
+        // One package and one DESCRIBES relationship per component, plus one per edge
+        doc.packages.reserve(self.components.len());
+        doc.relationships
+            .reserve(self.components.len() + self.edges.len());
 
-        // Create a map from coordinates to SPDX IDs
-        let mut coord_to_id: HashMap<String, String> = HashMap::new();
+        // Create a map from coordinates to full SPDX IDs, formatted once per package
+        let mut coord_to_id: HashMap<&str, String> = HashMap::with_capacity(self.components.len());
 
         // Add packages
         for (idx, component) in self.components.iter().enumerate() {
-            let spdx_id = format!("Package-{}", idx);
-            coord_to_id.insert(component.coordinates.clone(), spdx_id.clone());
-
-            let mut package = Package::new(&spdx_id, &component.name)
+            let mut package = Package::new(format!("Package-{}", idx), &component.name)
                 .with_version(&component.version)
                 .with_purl(&component.purl);
+            let spdx_id = package.spdxid.clone();
+            coord_to_id.insert(&component.coordinates, spdx_id.clone());
 
             // Set download location if repository is available
             if !component.repository.is_empty() {
@@ -78,19 +81,20 @@ impl BazelDependencyGraph {
             doc.add_relationship(Relationship {
                 spdx_element_id: "SPDXRef-DOCUMENT".to_string(),
                 relationship_type: "DESCRIBES".to_string(),
-                related_spdx_element: format!("SPDXRef-{}", spdx_id),
+                related_spdx_element: spdx_id,
             });
         }
 
         // Add dependency relationships
         for edge in &self.edges {
-            if let (Some(from_id), Some(to_id)) =
-                (coord_to_id.get(&edge.from), coord_to_id.get(&edge.to))
-            {
+            if let (Some(from_id), Some(to_id)) = (
+                coord_to_id.get(edge.from.as_str()),
+                coord_to_id.get(edge.to.as_str()),
+            ) {
                 doc.add_relationship(Relationship {
-                    spdx_element_id: format!("SPDXRef-{}", from_id),
+                    spdx_element_id: from_id.clone(),
                     relationship_type: "DEPENDS_ON".to_string(),
-                    related_spdx_element: format!("SPDXRef-{}", to_id),
+                    related_spdx_element: to_id.clone(),
                 });
             }
         }
@@ -883,6 +887,10 @@ mod tests {
             .iter()
             .find(|r| r.relationship_type == "DEPENDS_ON");
         assert!(depends_on.is_some());
+        let depends_on = depends_on.unwrap();
+        assert_eq!(depends_on.spdx_element_id, spdx.packages[0].spdxid);
+        assert_eq!(depends_on.related_spdx_element, spdx.packages[1].spdxid);
+        assert_eq!(spdx.packages[1].spdxid, "SPDXRef-Package-1");
     }
 
     #[test]
@@ -2549,26 +2549,9 @@ fn generate_layers_html(results: &ContainerScanResults) -> String {
     let mut layers_html = String::new();
     for (i, layer) in results.layers.iter().enumerate() {
         let vuln_count = layer.vulnerabilities.len();
-        let critical = layer
-            .vulnerabilities
-            .iter()
-            .filter(|v| v.severity == "CRITICAL")
-            .count();
-        let high = layer
-            .vulnerabilities
-            .iter()
-            .filter(|v| v.severity == "HIGH")
-            .count();
-        let medium = layer
-            .vulnerabilities
-            .iter()
-            .filter(|v| v.severity == "MEDIUM")
-            .count();
-        let low = layer
-            .vulnerabilities
-            .iter()
-            .filter(|v| v.severity == "LOW")
-            .count();
+        let (critical, high, medium, low) = bazbom::summary::count_by_severity(
+            layer.vulnerabilities.iter().map(|v| v.severity.as_str()),
+        );
 
         let status_class = if critical > 0 {
             "critical"
@@ -16,41 +16,13 @@ pub fn handle_vex_create(
     output: Option<String>,
 ) -> Result<()> {
     // Parse status
-    let vex_status = match status.to_lowercase().as_str() {
-        "not_affected" | "notaffected" => VexStatus::NotAffected,
-        "affected" => VexStatus::Affected,
-        "fixed" => VexStatus::Fixed,
-        "under_investigation" | "underinvestigation" => VexStatus::UnderInvestigation,
-        _ => {
-            anyhow::bail!(
-                "Invalid status '{}'. Valid values: not_affected, affected, fixed, under_investigation",
-                status
-            );
-        }
-    };
+    let vex_status: VexStatus = status.parse().map_err(anyhow::Error::msg)?;
 
     // Parse justification
-    let vex_justification = if let Some(j) = justification {
-        Some(match j.to_lowercase().as_str() {
-            "component_not_present" => VexJustification::ComponentNotPresent,
-            "vulnerable_code_not_present" => VexJustification::VulnerableCodeNotPresent,
-            "vulnerable_code_not_in_execute_path" => {
-                VexJustification::VulnerableCodeNotInExecutePath
-            }
-            "vulnerable_code_cannot_be_controlled_by_adversary" => {
-                VexJustification::VulnerableCodeCannotBeControlledByAdversary
-            }
-            "inline_mitigations_already_exist" => VexJustification::InlineMitigationsAlreadyExist,
-            _ => {
-                anyhow::bail!(
-                    "Invalid justification '{}'. Valid values: component_not_present, vulnerable_code_not_present, vulnerable_code_not_in_execute_path, vulnerable_code_cannot_be_controlled_by_adversary, inline_mitigations_already_exist",
-                    j
-                );
-            }
-        })
-    } else {
-        None
-    };
+    let vex_justification = justification
+        .map(|j| j.parse::<VexJustification>())
+        .transpose()
+        .map_err(anyhow::Error::msg)?;
 
     // Create document
     let doc_id = format!(
@@ -110,6 +82,11 @@ pub fn handle_vex_apply(vex_dir: String, findings: String, output: Option<String
     let vex_path = Path::new(&vex_dir);
     let findings_path = Path::new(&findings);
 
+    // Load findings first so a bad findings path fails before any VEX work
+    let findings_content = std::fs::read(findings_path).context("Failed to read findings file")?;
+    let mut findings_json: serde_json::Value =
+        serde_json::from_slice(&findings_content).context("Failed to parse findings JSON")?;
+
     // Load VEX filter
     println!();
     println!("{}", "🔄 Applying VEX statements...".bold());
@@ -117,47 +94,24 @@ pub fn handle_vex_apply(vex_dir: String, findings: String, output: Option<String
 
     let filter = VexFilter::load(vex_path).context("Failed to load VEX statements")?;
 
-    // Load findings
-    let findings_content =
-        std::fs::read_to_string(findings_path).context("Failed to read findings file")?;
-    let mut findings_json: serde_json::Value =
-        serde_json::from_str(&findings_content).context("Failed to parse findings JSON")?;
-
     // Apply filter to vulnerabilities
-    let mut suppressed_count = 0;
-    let mut kept_count = 0;
-    let mut suppressed_list = Vec::new();
-
-    if let Some(vulns) = findings_json
-        .get_mut("vulnerabilities")
-        .and_then(|v| v.as_array_mut())
-    {
-        let original_count = vulns.len();
-
-        vulns.retain(|v| {
-            let cve = v
-                .get("cve_id")
-                .or_else(|| v.get("cve"))
-                .and_then(|c| c.as_str())
-                .unwrap_or("");
-            let purl = v.get("package_url").and_then(|p| p.as_str());
-
-            if filter.should_suppress(cve, purl) {
-                suppressed_count += 1;
-                suppressed_list.push(cve.to_string());
-                false
-            } else {
-                kept_count += 1;
-                true
-            }
-        });
-
+    let original_count = findings_json
+        .get("vulnerabilities")
+        .and_then(|v| v.as_array())
+        .map(|v| v.len());
+    let suppressed_list = apply_vex_to_findings(&mut findings_json, &filter);
+    let suppressed_count = suppressed_list.len();
+
+    if let Some(original_count) = original_count {
         println!("  Original findings:  {}", original_count);
         println!(
             "  Suppressed by VEX:  {}",
             suppressed_count.to_string().green()
         );
-        println!("  Remaining:          {}", kept_count);
+        println!(
+            "  Remaining:          {}",
+            original_count - suppressed_count
+        );
     }
 
     // Add suppressed list to output
@@ -172,8 +126,8 @@ pub fn handle_vex_apply(vex_dir: String, findings: String, output: Option<String
         format!("{}_filtered.json", stem)
     });
 
-    let output_content = serde_json::to_string_pretty(&findings_json)?;
-    std::fs::write(&output_path, output_content).context("Failed to write filtered findings")?;
+    bazbom_formats::write_json_pretty(Path::new(&output_path), &findings_json)
+        .context("Failed to write filtered findings")?;
 
     println!();
     println!("  Output: {}", output_path.dimmed());
@@ -190,6 +144,36 @@ pub fn handle_vex_apply(vex_dir: String, findings: String, output: Option<String
     Ok(())
 }
 
+/// Drop findings suppressed by VEX from the `vulnerabilities` array in place
+///
+/// Returns the CVE IDs that were suppressed, in the order they appeared.
+fn apply_vex_to_findings(findings_json: &mut serde_json::Value, filter: &VexFilter) -> Vec<String> {
+    let mut suppressed_list = Vec::new();
+
+    if let Some(vulns) = findings_json
+        .get_mut("vulnerabilities")
+        .and_then(|v| v.as_array_mut())
+    {
+        vulns.retain(|v| {
+            let cve = v
+                .get("cve_id")
+                .or_else(|| v.get("cve"))
+                .and_then(|c| c.as_str())
+                .unwrap_or("");
+            let purl = v.get("package_url").and_then(|p| p.as_str());
+
+            if filter.should_suppress(cve, purl) {
+                suppressed_list.push(cve.to_string());
+                false
+            } else {
+                true
+            }
+        });
+    }
+
+    suppressed_list
+}
+
 /// Handle VEX list command
 pub fn handle_vex_list(vex_dir: String) -> Result<()> {
     let vex_path = Path::new(&vex_dir);
@@ -269,3 +253,61 @@ pub fn handle_vex_list(vex_dir: String) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn test_filter() -> VexFilter {
+        let mut doc = VexDocument::new("test", "test@test.com");
+        doc.add_statement(VexStatement::new("CVE-2023-0001", VexStatus::NotAffected));
+        doc.add_statement(VexStatement::new("CVE-2023-0002", VexStatus::Affected));
+        doc.add_statement(
+            VexStatement::new("CVE-2023-0003", VexStatus::Fixed)
+                .with_product("pkg:maven/com.example/foo@1.0.0"),
+        );
+        VexFilter::from_documents(&[doc])
+    }
+
+    #[test]
+    fn test_apply_vex_to_findings() {
+        let mut findings = serde_json::json!({
+            "vulnerabilities": [
+                {"cve_id": "CVE-2023-0001"},
+                {"cve": "CVE-2023-0002"},
+                {"cve_id": "CVE-2023-0003", "package_url": "pkg:maven/com.example/foo@1.0.0"},
+                {"cve_id": "CVE-2023-0003", "package_url": "pkg:maven/com.example/bar@1.0.0"},
+                {"cve_id": "CVE-2023-9999"}
+            ]
+        });
+
+        let suppressed = apply_vex_to_findings(&mut findings, &test_filter());
+
+        assert_eq!(suppressed, vec!["CVE-2023-0001", "CVE-2023-0003"]);
+        let remaining: Vec<&str> = findings["vulnerabilities"]
+            .as_array()
+            .unwrap()
+            .iter()
+            .map(|v| {
+                v.get("cve_id")
+                    .or_else(|| v.get("cve"))
+                    .and_then(|c| c.as_str())
+                    .unwrap()
+            })
+            .collect();
+        assert_eq!(
+            remaining,
+            vec!["CVE-2023-0002", "CVE-2023-0003", "CVE-2023-9999"]
+        );
+    }
+
+    #[test]
+    fn test_apply_vex_to_findings_without_vulnerabilities() {
+        let mut findings = serde_json::json!({"summary": {"total": 0}});
+
+        let suppressed = apply_vex_to_findings(&mut findings, &test_filter());
+
+        assert!(suppressed.is_empty());
+        assert_eq!(findings, serde_json::json!({"summary": {"total": 0}}));
+    }
+}
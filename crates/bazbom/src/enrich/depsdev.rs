@@ -97,11 +97,18 @@ struct DepsDevVersion {
 
 pub struct DepsDevClient {
     offline: bool,
+    /// Shared agent so keep-alive connections are reused across lookups
+    agent: ureq::Agent,
 }
 
 impl DepsDevClient {
     pub fn new(offline: bool) -> Self {
-        Self { offline }
+        let agent = ureq::Agent::config_builder()
+            .timeout_global(Some(std::time::Duration::from_secs(10)))
+            .build()
+            .new_agent();
+
+        Self { offline, agent }
     }
 
     /// Query deps.dev for package information by PURL
@@ -123,11 +130,8 @@ impl DepsDevClient {
             urlencoding::encode(&version)
         );
 
-        let agent = ureq::Agent::config_builder()
-            .timeout_global(Some(std::time::Duration::from_secs(10)))
-            .build()
-            .new_agent();
-        let response = agent
+        let response = self
+            .agent
             .get(&url)
             .call()
             .context("deps.dev API request failed")?;
@@ -223,11 +227,8 @@ impl DepsDevClient {
             urlencoding::encode(to_version)
         );
 
-        let agent = ureq::Agent::config_builder()
-            .timeout_global(Some(std::time::Duration::from_secs(10)))
-            .build()
-            .new_agent();
-        let response = agent
+        let response = self
+            .agent
             .get(&url)
             .call()
             .context("deps.dev API request failed for breaking changes")?;
@@ -245,20 +246,19 @@ impl DepsDevClient {
         if let Some(version_details) = &deps_dev_resp.version {
             if let Some(links) = &version_details.links {
                 for link in links {
+                    let url = link.url.to_lowercase();
                     match link.label.as_str() {
                         "SOURCE_REPO" | "HOMEPAGE" => {
-                            if link.url.to_lowercase().contains("changelog")
-                                || link.url.to_lowercase().contains("releases")
-                                || link.url.to_lowercase().contains("release-notes")
+                            if url.contains("changelog")
+                                || url.contains("releases")
+                                || url.contains("release-notes")
                             {
                                 changelog_url = Some(link.url.clone());
                             }
                         }
                         _ => {
                             // Look for migration guides in any link
-                            if link.url.to_lowercase().contains("migration")
-                                || link.url.to_lowercase().contains("upgrade")
-                            {
+                            if url.contains("migration") || url.contains("upgrade") {
                                 migration_guide_url = Some(link.url.clone());
                             }
                         }
@@ -270,9 +270,8 @@ impl DepsDevClient {
             if let Some(advisories) = &version_details.advisories {
                 for advisory in advisories {
                     if let Some(desc) = &advisory.description {
-                        if desc.to_lowercase().contains("breaking")
-                            || desc.to_lowercase().contains("incompatible")
-                        {
+                        let lower = desc.to_lowercase();
+                        if lower.contains("breaking") || lower.contains("incompatible") {
                             details.push(desc.clone());
                         }
                     }
@@ -2,6 +2,7 @@
 
 use bazbom_core::BuildSystem;
 use bazbom_vulnerabilities::Vulnerability;
+use std::collections::HashMap;
 
 use super::types::{RemediationReport, RemediationSuggestion, RemediationSummary};
 use super::version::parse_semantic_version;
@@ -97,28 +98,37 @@ fn estimate_effort(fixable: usize) -> String {
 }
 
 /// Enrich remediation suggestions with deps.dev breaking changes information
+///
+/// Several suggestions often share the same package and fixed version (one per
+/// CVE), so each PURL is looked up at most once per report.
 pub fn enrich_with_depsdev(
     mut report: RemediationReport,
     depsdev_client: &DepsDevClient,
 ) -> RemediationReport {
+    let mut lookups: HashMap<String, Option<BreakingChanges>> = HashMap::new();
+
     for suggestion in &mut report.suggestions {
         if let Some(ref fixed_version) = suggestion.fixed_version {
             if let Some(purl) = construct_purl(&suggestion.affected_package, fixed_version) {
-                if let Ok(package_info) = depsdev_client.get_package_info(&purl) {
-                    if let Some(breaking_changes) = package_info.breaking_changes {
-                        suggestion.breaking_changes =
-                            Some(format_breaking_changes(&breaking_changes));
-
-                        if let Some(url) = breaking_changes.changelog_url {
-                            if !suggestion.references.contains(&url) {
-                                suggestion.references.push(url);
-                            }
+                let breaking_changes = lookups.entry(purl).or_insert_with_key(|purl| {
+                    depsdev_client
+                        .get_package_info(purl)
+                        .ok()
+                        .and_then(|package_info| package_info.breaking_changes)
+                });
+
+                if let Some(breaking_changes) = breaking_changes {
+                    suggestion.breaking_changes = Some(format_breaking_changes(breaking_changes));
+
+                    if let Some(ref url) = breaking_changes.changelog_url {
+                        if !suggestion.references.contains(url) {
+                            suggestion.references.push(url.clone());
                         }
+                    }
 
-                        if let Some(url) = breaking_changes.migration_guide_url {
-                            if !suggestion.references.contains(&url) {
-                                suggestion.references.push(url);
-                            }
+                    if let Some(ref url) = breaking_changes.migration_guide_url {
+                        if !suggestion.references.contains(url) {
+                            suggestion.references.push(url.clone());
                         }
                     }
                 }
@@ -148,11 +158,15 @@ fn format_breaking_changes(breaking_changes: &BreakingChanges) -> String {
     }
 
     if let Some(ref url) = breaking_changes.changelog_url {
-        output.push_str(&format!("Changelog: {}\n", url));
+        output.push_str("Changelog: ");
+        output.push_str(url);
+        output.push('\n');
     }
 
     if let Some(ref url) = breaking_changes.migration_guide_url {
-        output.push_str(&format!("Migration guide: {}\n", url));
+        output.push_str("Migration guide: ");
+        output.push_str(url);
+        output.push('\n');
     }
 
     output
@@ -13,11 +13,7 @@
 #[allow(clippy::should_implement_trait)]
 pub fn parse_semantic_version(version: &str) -> Option<(u32, u32, u32)> {
     let clean_version = version.split('-').next()?;
-    let parts: Vec<&str> = clean_version.split('.').collect();
-
-    if parts.len() < 3 {
-        return None;
-    }
+    let mut parts = clean_version.split('.');
 
     let parse_part = |s: &str| -> Option<u32> {
         if s.chars().all(|c| c.is_ascii_digit()) {
@@ -27,9 +23,9 @@ pub fn parse_semantic_version(version: &str) -> Option<(u32, u32, u32)> {
         }
     };
 
-    let major = parse_part(parts[0])?;
-    let minor = parse_part(parts[1])?;
-    let patch = parse_part(parts[2])?;
+    let major = parse_part(parts.next()?)?;
+    let minor = parse_part(parts.next()?)?;
+    let patch = parse_part(parts.next()?)?;
 
     Some((major, minor, patch))
 }
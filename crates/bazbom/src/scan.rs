@@ -432,7 +432,7 @@ pub fn handle_legacy_scan(
                 }
 
                 let cdx_path = out.join("sbom.cyclonedx.json");
-                std::fs::write(&cdx_path, serde_json::to_string_pretty(&cdx_doc)?)?;
+                bazbom_formats::write_json_pretty(&cdx_path, &cdx_doc)?;
                 tracing::info!("Wrote CycloneDX 1.5 SBOM to {:?}", cdx_path);
                 println!("[bazbom] wrote CycloneDX 1.5 SBOM to {:?}", cdx_path);
             }
@@ -535,7 +535,7 @@ pub fn handle_legacy_scan(
                 };
 
                 let spdx_path = out.join("sbom.spdx.json");
-                std::fs::write(&spdx_path, serde_json::to_string_pretty(&unified_sbom)?)?;
+                bazbom_formats::write_json_pretty(&spdx_path, &unified_sbom)?;
                 tracing::info!("Wrote SPDX 2.3 SBOM to {:?}", spdx_path);
                 println!("[bazbom] wrote SPDX 2.3 SBOM to {:?}", spdx_path);
             }
@@ -743,7 +743,7 @@ impl ScanOrchestrator {
         scan_result: &bazbom_containers::DetailedScanResult,
         output_path: &std::path::Path,
     ) -> Result<()> {
-        use bazbom_formats::spdx::{Package, SpdxDocument};
+        use bazbom_formats::spdx::{sanitize_spdx_id, Package, SpdxDocument};
 
         println!();
         println!("   📝 Generating container SBOM...");
@@ -758,7 +758,7 @@ impl ScanOrchestrator {
         let container_pkg = Package {
             spdxid: format!(
                 "SPDXRef-Package-{}",
-                scan_result.image.name.replace(':', "-")
+                sanitize_spdx_id(&scan_result.image.name)
             ),
             name: scan_result.image.name.clone(),
             version_info: Some("latest".to_string()),
@@ -777,7 +777,7 @@ impl ScanOrchestrator {
                 Package {
                     spdxid: format!(
                         "SPDXRef-Package-{}-{}",
-                        coords.artifact_id.replace('.', "-"),
+                        sanitize_spdx_id(&coords.artifact_id),
                         idx
                     ),
                     name: format!("{}:{}", coords.group_id, coords.artifact_id),
@@ -806,8 +806,7 @@ impl ScanOrchestrator {
         }
 
         // Write SBOM to file
-        let json = serde_json::to_string_pretty(&doc)?;
-        std::fs::write(output_path, json)?;
+        bazbom_formats::write_json_pretty(output_path, &doc)?;
 
         Ok(())
     }
@@ -818,7 +817,7 @@ impl ScanOrchestrator {
         scan_result: &bazbom_containers::ContainerScanResult,
         output_path: &std::path::Path,
     ) -> Result<()> {
-        use bazbom_formats::spdx::{Package, SpdxDocument};
+        use bazbom_formats::spdx::{sanitize_spdx_id, Package, SpdxDocument};
 
         println!("[bazbom] generating container SBOM...");
 
@@ -832,7 +831,7 @@ impl ScanOrchestrator {
         let container_pkg = Package {
             spdxid: format!(
                 "SPDXRef-Package-{}",
-                scan_result.image.name.replace(':', "-")
+                sanitize_spdx_id(&scan_result.image.name)
             ),
             name: scan_result.image.name.clone(),
             version_info: Some("latest".to_string()),
@@ -851,7 +850,7 @@ impl ScanOrchestrator {
                 Package {
                     spdxid: format!(
                         "SPDXRef-Package-{}-{}",
-                        coords.artifact_id.replace('.', "-"),
+                        sanitize_spdx_id(&coords.artifact_id),
                         idx
                     ),
                     name: format!("{}:{}", coords.group_id, coords.artifact_id),
@@ -880,8 +879,7 @@ impl ScanOrchestrator {
         }
 
         // Write SBOM to file
-        let json = serde_json::to_string_pretty(&doc)?;
-        std::fs::write(output_path, json)?;
+        bazbom_formats::write_json_pretty(output_path, &doc)?;
 
         Ok(())
     }
@@ -1282,26 +1280,9 @@ impl ScanOrchestrator {
 
                 // Show vulnerability summary if any found
                 if result.total_vulnerabilities > 0 {
-                    let critical = result
-                        .vulnerabilities
-                        .iter()
-                        .filter(|v| v.severity == "CRITICAL")
-                        .count();
-                    let high = result
-                        .vulnerabilities
-                        .iter()
-                        .filter(|v| v.severity == "HIGH")
-                        .count();
-                    let medium = result
-                        .vulnerabilities
-                        .iter()
-                        .filter(|v| v.severity == "MEDIUM")
-                        .count();
-                    let low = result
-                        .vulnerabilities
-                        .iter()
-                        .filter(|v| v.severity == "LOW")
-                        .count();
+                    let (critical, high, medium, low) = crate::summary::count_by_severity(
+                        result.vulnerabilities.iter().map(|v| v.severity.as_str()),
+                    );
 
                     if critical > 0 || high > 0 {
                         println!(
@@ -1457,7 +1438,7 @@ impl ScanOrchestrator {
             };
             let spdx_path = self.context.sbom_dir.join("spdx.json");
             std::fs::create_dir_all(&self.context.sbom_dir)?;
-            std::fs::write(&spdx_path, serde_json::to_string_pretty(&unified_sbom)?)?;
+            bazbom_formats::write_json_pretty(&spdx_path, &unified_sbom)?;
             tracing::debug!("Wrote unified SPDX SBOM to {:?}", spdx_path);
             println!("[bazbom] wrote unified SPDX SBOM to {:?}", spdx_path);
             spdx_path
@@ -1492,8 +1473,7 @@ impl ScanOrchestrator {
                 }
             }
 
-            let json = serde_json::to_string_pretty(&cdx_doc)?;
-            std::fs::write(&cyclonedx_path, json)?;
+            bazbom_formats::write_json_pretty(&cyclonedx_path, &cdx_doc)?;
             tracing::info!(
                 "Wrote CycloneDX SBOM with {} components to {:?}",
                 component_count,
@@ -326,6 +326,25 @@ pub fn format_duration(duration: Duration) -> String {
     }
 }
 
+/// Count `CRITICAL`/`HIGH`/`MEDIUM`/`LOW` severities as `(critical, high, medium, low)`
+///
+/// Any other severity label is ignored.
+pub fn count_by_severity<'a>(
+    severities: impl IntoIterator<Item = &'a str>,
+) -> (usize, usize, usize, usize) {
+    let (mut critical, mut high, mut medium, mut low) = (0, 0, 0, 0);
+    for severity in severities {
+        match severity {
+            "CRITICAL" => critical += 1,
+            "HIGH" => high += 1,
+            "MEDIUM" => medium += 1,
+            "LOW" => low += 1,
+            _ => {}
+        }
+    }
+    (critical, high, medium, low)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -372,4 +391,13 @@ mod tests {
         assert_eq!(format_duration(Duration::from_secs(135)), "2m 15s");
         assert_eq!(format_duration(Duration::from_secs(3665)), "1h 1m");
     }
+
+    #[test]
+    fn test_count_by_severity() {
+        let severities = [
+            "CRITICAL", "HIGH", "HIGH", "LOW", "UNKNOWN", "MEDIUM", "LOW",
+        ];
+        assert_eq!(count_by_severity(severities), (1, 2, 1, 2));
+        assert_eq!(count_by_severity([]), (0, 0, 0, 0));
+    }
 }